@@ -13,13 +13,16 @@ class Configurations(object):
 	:cvar config_f: The configurations file loaded
 	:cvar document: The configurations JSON parsed content
 	:cvar got_file: If the class got a configurations file loaded
+	:cvar read_only: If the document was loaded from a ConfigSnapshot, then it's never written to the file
 	:type config_f: basestring
 	:type document: dict
 	:type got_file: bool
+	:type read_only: bool
 	"""
 	config_f: AnyStr
 	got_file: bool = False
 	document: dict = dict()
+	read_only: bool = False
 
 	class ConfigurationsLoadError(Exception):
 		"""
@@ -162,10 +165,11 @@ class Configurations(object):
 		"""
 		Writes all the changes on the configurations file loaded. Normally used when the configurations file is unloaded.
 		:param formatting: If the JSON content will be formatted, adding a new line at every '{', '}', "[", "]", ","
-		:except ConfigurationsLoadError: If there's no configurations file loaded yet.
+		:except ConfigurationsLoadError: If there's no configurations file loaded yet, or if it's read-only.
 		:return: Nothing
 		"""
 		if not self.got_file: raise self.ConfigurationsLoadError("There's no configurations file loaded yet")
+		if self.read_only: raise self.ConfigurationsLoadError("The configurations were loaded from a snapshot (read-only)")
 		with open(self.config_f, mode="w", encoding="UTF-8") as fl:
 			dumped = dumps(self.document)
 			fl.write(dumped if not formatting else self.format_json(dumped))
@@ -173,15 +177,40 @@ class Configurations(object):
 
 	def unload_file(self):
 		"""
-		Unset the class attributes, unparsing the configurations file loaded.
+		Unset the class attributes, unparsing the configurations file loaded. The changes are commited, unless the
+		configurations were loaded from a snapshot.
 		:except ConfigurationsLoadError: If there's no configurations file loaded yet.
 		:return: Nothing
 		"""
 		if not self.got_file: raise self.ConfigurationsLoadError("There's no configurations file loaded yet")
-		self.commit()
+		if not self.read_only: self.commit()
 		self.document = {}
 		self.config_f = ""
 		self.got_file = False
+		self.read_only = False
+
+	def dump_snapshot(self) -> tuple:
+		"""
+		Returns the configurations file and the document loaded, to be published with the ConfigSnapshot class.
+		:except ConfigurationsLoadError: If there's no configurations file loaded yet.
+		:return: The configurations file path and the parsed document.
+		"""
+		if not self.got_file: raise self.ConfigurationsLoadError("There's no configurations file loaded yet")
+		return self.config_f, self.document
+
+	def load_snapshot(self, snapshot, section: str = "Configurations"):
+		"""
+		Loads the configurations already checked by the parent process from a ConfigSnapshot, without reading the
+		file. The document loaded is read-only, it's never commited to the configurations file.
+		:param snapshot: The ConfigSnapshot attached.
+		:param section: The snapshot section with the configurations.
+		:except ConfigurationsLoadError: If there's another configurations file loaded already.
+		:return: Nothing
+		"""
+		if self.got_file: raise self.ConfigurationsLoadError("There's another configurations file loaded already;")
+		self.config_f, self.document = snapshot.get(section)
+		self.read_only = True
+		self.got_file = True
 
 	def __init__(self, config: AnyStr = None):
 		"""
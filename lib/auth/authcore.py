@@ -15,14 +15,17 @@ class SocketConfig(object):
 	:cvar config: The configurations parsed.
 	:cvar got_file: If the class got a configurations file.
 	:cvar file_got: The configurations file that the class got.
+	:cvar read_only: If the configurations were loaded from a ConfigSnapshot, then they're never written to the file.
 	:type file_got: basestring
 	:type got_file: False
 	:type config: dict
+	:type read_only: bool
 	:author Giulliano Rossi <giulliano.scatalon.rossi@gmail.com>
 	"""
 	file_got: AnyStr
 	config: dict
 	got_file: bool = False
+	read_only: bool = False
 
 	################################################################################
 	# Exceptions
@@ -129,11 +132,12 @@ class SocketConfig(object):
 	def commit(self, format_json: bool = False):
 		"""
 		Write all the changes done on the loaded document to the configurations file loaded.
-		:except ConfigLoadError: If there's no configurations file loaded yet;
+		:except ConfigLoadError: If there's no configurations file loaded yet, or if it's read-only;
 		:param format_json: If the "{" and "," at the document will be succeeded by a new line
 		:return: None
 		"""
 		if not self.got_file: raise self.ConfigLoadError("There's no configurations file loaded yet!")
+		if self.read_only: raise self.ConfigLoadError("The configurations were loaded from a snapshot (read-only)")
 		with open(self.file_got, mode="w", encoding="utf-8") as file:
 			dumped = dumps(self.config)
 			if format_json:
@@ -149,15 +153,39 @@ class SocketConfig(object):
 
 	def unload(self):
 		"""
-		Unload the configurations file loaded, unseting the class attributes that the class just loaded.
+		Unload the configurations file loaded, unseting the class attributes that the class just loaded. The changes
+		are commited, unless the configurations were loaded from a snapshot.
 		:except ConfigLoadError: If the configurations file wasn't loaded yet.
 		:return: Nothing
 		"""
 		if not self.got_file: raise self.ConfigLoadError("There's no configurations file loaded yet;")
-		self.commit()
-		self.config   = dict()
-		self.file_got = ""
-		self.got_file = False
+		if not self.read_only: self.commit()
+		self.config    = dict()
+		self.file_got  = ""
+		self.got_file  = False
+		self.read_only = False
+
+	def dump_snapshot(self) -> tuple:
+		"""
+		Returns the configurations file and the configurations loaded, to be published with the ConfigSnapshot class.
+		:except ConfigLoadError: If there's no configurations file loaded yet.
+		:return: The configurations file path and the parsed configurations.
+		"""
+		if not self.got_file: raise self.ConfigLoadError("There's no configurations file loaded yet!")
+		return self.file_got, self.config
+
+	def load_snapshot(self, snapshot, section: str = "SocketConfig"):
+		"""
+		Loads the configurations already checked by the parent process from a ConfigSnapshot, without reading the
+		file. The configurations loaded are read-only, they're never commited to the configurations file.
+		:param snapshot: The ConfigSnapshot attached.
+		:param section: The snapshot section with the socket configurations.
+		:except ConfigLoadError: If there's another configurations file loaded already.
+		"""
+		if self.got_file: raise self.ConfigLoadError("There's another configurations file loaded already", 1)
+		self.file_got, self.config = snapshot.get(section)
+		self.read_only = True
+		self.got_file = True
 
 	def __init__(self, config: AnyStr = None):
 		"""
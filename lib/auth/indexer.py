@@ -0,0 +1,211 @@
+# coding = utf-8
+# using namespace std
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from json import loads
+from json import dumps
+from json import JSONDecodeError
+from os import walk, stat, replace
+from os.path import join, abspath
+from typing import AnyStr
+
+
+SIGNATURE_FIELDS = ["Client", "Proprietary", "Token", "Dt"]
+
+
+def ck_signature(content: str) -> tuple:
+	"""
+	Check the structure of a .lpgp signature content. To be a valid signature, the content must be a list of char codes
+	separated by "/" that, decoded, is a JSON document with the following fields:
+		* Client      (str)
+		* Proprietary (str)
+		* Token       (str)
+		* Dt          (str)
+	:param content: The signature file content.
+	:return: One tuple, at the 0 index if the signature is valid (bool) and at the 1 index the error message (str/None)
+	"""
+	try: decoded = "".join(chr(int(code)) for code in content.strip().split("/"))
+	except (ValueError, OverflowError): return False, "Invalid char code at the signature content"
+	try: prs = loads(decoded)
+	except JSONDecodeError as e: return False, "Can't parse the decoded signature: " + e.msg
+	if type(prs) is not dict: return False, "Expecting a JSON object at the signature content"
+	for field in SIGNATURE_FIELDS:
+		if field not in prs.keys(): return False, f"Missing field '{field}'"
+		elif type(prs[field]) is not str: return False, f"Invalid value at the '{field}' field"
+	for field in prs.keys():
+		if field not in SIGNATURE_FIELDS: return False, f"Invalid field '{field}'"
+	return True, None
+
+
+def digest_file(path: AnyStr) -> tuple:
+	"""
+	Reads a signature file, computing the content digest and checking the structure. That function runs at the worker
+	processes of the SignatureIndex, so any error is returned at the file result instead of aborting the whole scan.
+	:param path: The signature file to read.
+	:return: One tuple with the file path, the SHA-256 hex digest (str/None), if the file is valid and the error message
+	"""
+	try:
+		with open(path, "rb") as sig: raw = sig.read()
+	except OSError as e: return path, None, False, f"Can't access the file [{e.strerror}]"
+	try: valid, error = ck_signature(raw.decode("utf-8"))
+	except UnicodeDecodeError: valid, error = False, "Expecting a UTF-8 signature file"
+	except Exception as e: valid, error = False, f"Can't check the signature [{type(e).__name__}]"
+	return path, sha256(raw).hexdigest(), valid, error
+
+
+class SignatureIndex(object):
+	"""
+	That class keeps a index of the .lpgp signature files found at directories, with the content digest and the
+	structure check of every file. The index is stored at a JSON file, keyed by the file path, with the file mtime and
+	size, so a new scan only reads the files that changed since the last one. That way the signatures can be checked
+	locally before sending them to the authentication server.
+	Every entry of the index document is a list with the following values:
+		[mtime (int, ns), size (int), digest (str/None), valid (bool), error (str/None)]
+	:cvar index_f: The index file loaded.
+	:cvar document: The index entries, by the signature file path.
+	:cvar got_file: If the class got a index file loaded.
+	:type index_f: basestring
+	:type document: dict
+	:type got_file: bool
+	"""
+	index_f: AnyStr
+	document: dict
+	got_file: bool = False
+
+	class IndexLoadError(Exception):
+		"""
+		<Exception> Raised when the class try to do any action with the index file, but there's no index file loaded
+		yet. Also raised when the class try to load a index file but there's another file loaded already.
+		"""
+
+	class InvalidIndex(Exception):
+		"""
+		<Exception> Raised when the class try to load a index file that can't be parsed.
+		"""
+
+	def load_file(self, index: AnyStr):
+		"""
+		Loads a index file to the class attributes. If the file don't exist yet the index starts empty, and the file
+		will be created at the commit.
+		:param index: The index file to load.
+		:except IndexLoadError: If there's another index file loaded already.
+		:except InvalidIndex: If the index file can't be parsed.
+		:return: Nothing
+		"""
+		if self.got_file: raise self.IndexLoadError("There's another index file loaded already")
+		try:
+			with open(index, "r", encoding="utf-8") as idx: prs = loads(idx.read())
+		except FileNotFoundError: prs = dict()
+		except JSONDecodeError as e: raise self.InvalidIndex(f"Can't read the JSON content! [{e.msg}::{e.pos}]")
+		if type(prs) is not dict: raise self.InvalidIndex("Expecting a JSON object at the index file")
+		self.index_f = index
+		self.document = prs
+		self.got_file = True
+
+	def commit(self):
+		"""
+		Writes the index entries to the index file loaded. The content is written to a temporary file first, so a
+		interrupted commit don't corrupt the index.
+		:except IndexLoadError: If there's no index file loaded yet.
+		:return: Nothing
+		"""
+		if not self.got_file: raise self.IndexLoadError("There's no index file loaded yet")
+		tmp = self.index_f + ".tmp"
+		with open(tmp, "w", encoding="utf-8") as idx: idx.write(dumps(self.document, separators=(",", ":")))
+		replace(tmp, self.index_f)
+
+	def unload_file(self):
+		"""
+		Commit the index entries and unset the class attributes.
+		:except IndexLoadError: If there's no index file loaded yet.
+		:return: Nothing
+		"""
+		if not self.got_file: raise self.IndexLoadError("There's no index file loaded yet")
+		self.commit()
+		self.document = dict()
+		self.index_f = ""
+		self.got_file = False
+
+	def __init__(self, index: AnyStr = None):
+		"""
+		Starts the class, loading a index file if it's not None.
+		:param index: The index file to load automatically.
+		"""
+		self.document = dict()
+		self.index_f = ""
+		if index is not None: self.load_file(index)
+
+	@staticmethod
+	def find_signatures(directory: AnyStr, extension: str = ".lpgp") -> list:
+		"""
+		Search all the signature files at a directory and at it sub-directories.
+		:param directory: The directory to search.
+		:param extension: The extension of the signature files.
+		:return: The absolute path of every signature file found.
+		"""
+		found = []
+		for root, dirs, files in walk(directory):
+			for fl in files:
+				if fl.endswith(extension): found.append(abspath(join(root, fl)))
+		return found
+
+	def scan(self, directories: list, workers: int = None, chunksize: int = 64) -> dict:
+		"""
+		Scans directories of signature files, updating the index. Only the files that are new, that the mtime or size
+		changed, or that couldn't be read at the last scan, are read again, using a process pool. The files of the
+		scanned directories that don't exist anymore are removed from the index.
+		:param directories: The directories to scan.
+		:param workers: The number of worker processes, if it's None will use the number of CPUs.
+		:param chunksize: How many files are sent to a worker process at once.
+		:except IndexLoadError: If there's no index file loaded yet.
+		:return: A dict with the number of files 'Added', 'Updated', 'Removed' and 'Unchanged'.
+		"""
+		if not self.got_file: raise self.IndexLoadError("There's no index file loaded yet")
+		stats = {"Added": 0, "Updated": 0, "Removed": 0, "Unchanged": 0}
+		seen = dict()
+		for directory in directories:
+			for path in self.find_signatures(directory):
+				try: st = stat(path)
+				except OSError: continue
+				seen[path] = (st.st_mtime_ns, st.st_size)
+		changed = []
+		for path, (mtime, size) in seen.items():
+			entry = self.document.get(path)
+			if entry is not None and entry[0] == mtime and entry[1] == size and entry[2] is not None:
+				stats['Unchanged'] += 1
+			else: changed.append(path)
+		prefixes = tuple(join(abspath(directory), "") for directory in directories)
+		for path in list(self.document.keys()):
+			if path.startswith(prefixes) and path not in seen:
+				del self.document[path]
+				stats['Removed'] += 1
+		if len(changed) > 0:
+			with ProcessPoolExecutor(max_workers=workers) as pool:
+				for path, digest, valid, error in pool.map(digest_file, changed, chunksize=chunksize):
+					stats['Updated' if path in self.document else 'Added'] += 1
+					mtime, size = seen[path]
+					self.document[path] = [mtime, size, digest, valid, error]
+		self.commit()
+		return stats
+
+	def get_entry(self, path: AnyStr) -> dict:
+		"""
+		Returns the index entry of a signature file.
+		:param path: The signature file path.
+		:except IndexLoadError: If there's no index file loaded yet.
+		:return: The entry as a dict with the 'Mtime', 'Size', 'Digest', 'Valid' and 'Error' fields, or None if the file
+					isn't indexed.
+		"""
+		if not self.got_file: raise self.IndexLoadError("There's no index file loaded yet")
+		entry = self.document.get(abspath(path))
+		if entry is None: return None
+		return dict(zip(["Mtime", "Size", "Digest", "Valid", "Error"], entry))
+
+	def invalid_signatures(self) -> list:
+		"""
+		Returns all the indexed signature files that aren't valid.
+		:except IndexLoadError: If there's no index file loaded yet.
+		:return: A list of tuples with the file path and the error message.
+		"""
+		if not self.got_file: raise self.IndexLoadError("There's no index file loaded yet")
+		return [(path, entry[4]) for path, entry in self.document.items() if not entry[3]]
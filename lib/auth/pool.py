@@ -0,0 +1,303 @@
+# coding = utf-8
+# using namespace std
+from threading import Condition
+from time import monotonic
+from typing import AnyStr, Callable
+
+
+class ConnectionPool(object):
+	"""
+	That class keeps the database connections opened with the database access returned by the Client4.connect_auth
+	method, so the callers don't need to open a new connection at every request. The pool don't depend on any database
+	driver, it just receives a connector, that's any callable that receives the database access and returns a DB-API
+	connection. The connections are used and released by different threads, so a driver that binds the connection to
+	the thread that opened it needs to disable that check, like partial(sqlite3.connect, check_same_thread=False).
+	The connections are kept by the database access, so when the authentication server answers with another database
+	access (credential rotation) the old connections are closed and the new ones are opened with the new access.
+	:cvar connector: The callable that opens a new connection with a database access.
+	:cvar max_size: The max number of connections (idle and in use) that the pool keeps for the same database access.
+	:cvar idle_timeout: The time (seconds) that a idle connection can stay at the pool before being closed.
+	:cvar validate: If the pool will check the connection before giving it to the caller.
+	:cvar access: The current database access of the pool.
+	:cvar idle: The idle connections of every database access, with the time that they were released.
+	:cvar in_use: How many connections are in use for every database access.
+	:cvar owners: The database access of every connection in use (by the connection id).
+	:type connector: Callable
+	:type max_size: int
+	:type idle_timeout: float
+	:type validate: bool
+	:type access: basestring
+	:type idle: dict
+	:type in_use: dict
+	:type owners: dict
+	"""
+	connector: Callable
+	max_size: int
+	idle_timeout: float
+	validate: bool
+	access: AnyStr = None
+	idle: dict
+	in_use: dict
+	owners: dict
+	cond: Condition
+
+	class PoolExhausted(Exception):
+		"""
+		<Exception> Raised when the pool try to give a connection, but all the connections of the database access are
+		in use and none of them was released before the timeout.
+		"""
+
+	class AccessNotLoaded(Exception):
+		"""
+		<Exception> Raised when the pool try to open a connection but there's no database access loaded yet. Also raised
+		when the authentication response don't have a database access (invalid client file).
+		"""
+
+	class UnknownConnection(Exception):
+		"""
+		<Exception> Raised when the pool receives a connection that wasn't taken from it.
+		"""
+
+	def __init__(self, connector: Callable, max_size: int = 5, idle_timeout: float = 300.0, validate: bool = True,
+				access: AnyStr = None):
+		"""
+		Starts the pool, without any connection opened.
+		:param connector: The callable that opens a connection with the database access.
+		:param max_size: The max number of connections for the same database access.
+		:param idle_timeout: The time (seconds) that a idle connection can stay at the pool, if it's None the idle
+								connections will never be closed by the time.
+		:param validate: If the pool will check the idle connections before giving them to the caller.
+		:param access: The database access to load automatically.
+		"""
+		if max_size <= 0: raise ValueError("The max size of the pool must be bigger than 0")
+		self.connector = connector
+		self.max_size = max_size
+		self.idle_timeout = idle_timeout
+		self.validate = validate
+		self.idle = dict()
+		self.in_use = dict()
+		self.owners = dict()
+		self.cond = Condition()
+		if access is not None: self.set_access(access)
+
+	@staticmethod
+	def close_conn(conn):
+		"""
+		Closes a connection ignoring any error of the driver, used when the connection is already broken.
+		:param conn: The connection to close.
+		:return: Nothing
+		"""
+		try: conn.close()
+		except Exception: pass
+
+	@staticmethod
+	def ckconn(conn) -> bool:
+		"""
+		Check if a connection is still usable, executing a simple query on it.
+		:param conn: The connection to check.
+		:return: True if the connection answered the query, False if it didn't.
+		"""
+		try:
+			cursor = conn.cursor()
+			try: cursor.execute("SELECT 1")
+			finally: cursor.close()
+		except Exception: return False
+		else: return True
+
+	def drop_access(self, access: AnyStr):
+		"""
+		Closes all the idle connections of a database access. The connections in use will be closed when released.
+		:param access: The database access to drop.
+		:return: Nothing
+		"""
+		with self.cond:
+			dropped = self.idle.pop(access, [])
+			self.cond.notify_all()
+		for conn, released in dropped: self.close_conn(conn)
+
+	def set_access(self, access: AnyStr) -> bool:
+		"""
+		Set the current database access of the pool. If the access changed (credential rotation) the connections of
+		the old access are dropped.
+		:param access: The new database access.
+		:except AccessNotLoaded: If the database access is None or empty.
+		:return: True if the database access changed, False if it's the same access.
+		"""
+		if access is None or len(access) <= 0: raise self.AccessNotLoaded("Invalid database access")
+		with self.cond:
+			if access == self.access: return False
+			old = self.access
+			self.access = access
+		if old is not None: self.drop_access(old)
+		return True
+
+	def from_auth(self, response: tuple) -> bool:
+		"""
+		Loads the database access from the response of the Client4.connect_auth method.
+		:param response: The tuple returned by the connect_auth method.
+		:except AccessNotLoaded: If the response don't have a database access (the client file isn't valid).
+		:return: True if the database access changed, False if it's the same access.
+		"""
+		if len(response) < 2 or response[1] is None:
+			raise self.AccessNotLoaded("The authentication response don't have a database access")
+		return self.set_access(response[1])
+
+	def prune(self):
+		"""
+		Closes all the idle connections that stayed at the pool more time than the idle timeout.
+		:return: Nothing
+		"""
+		if self.idle_timeout is None: return
+		expired = []
+		with self.cond:
+			limit = monotonic() - self.idle_timeout
+			for access in list(self.idle.keys()):
+				alive = []
+				for conn, released in self.idle[access]:
+					if released < limit: expired.append(conn)
+					else: alive.append((conn, released))
+				if len(alive) > 0: self.idle[access] = alive
+				else: del self.idle[access]
+		for conn in expired: self.close_conn(conn)
+
+	def free_slot(self, access: AnyStr):
+		"""
+		Gives back the slot of a connection that isn't in use anymore, waking up the callers that are waiting. All of
+		them are woken up, since they share the same lock but may be waiting for different database accesses. Must be
+		called with the pool lock held.
+		:param access: The database access of the connection.
+		:return: Nothing
+		"""
+		self.in_use[access] -= 1
+		if self.in_use[access] <= 0: del self.in_use[access]
+		self.cond.notify_all()
+
+	def acquire(self, access: AnyStr = None, timeout: float = None):
+		"""
+		Gives a connection of the pool to the caller. If there's a idle connection it's reused, else a new connection
+		is opened. If all the connections are in use the method waits one of them to be released. The lock of the pool
+		is only held to take the connection slot, the validation and the connection itself are done without it.
+		:param access: The database access of the connection, if it's None will use the current database access.
+		:param timeout: The time (seconds) to wait a connection be released, if it's None will wait forever.
+		:except AccessNotLoaded: If there's no database access loaded yet.
+		:except PoolExhausted: If no connection was released before the timeout.
+		:return: The DB-API connection.
+		"""
+		self.prune()
+		requested = access
+		deadline = None if timeout is None else monotonic() + timeout
+		while True:
+			with self.cond:
+				while True:
+					# the current access is read again at every pass, it may rotate while the caller is waiting
+					access = self.access if requested is None else requested
+					if access is None: raise self.AccessNotLoaded("There's no database access loaded yet")
+					stack = self.idle.get(access, [])
+					if len(stack) > 0:
+						conn = stack.pop()[0]
+						break
+					if self.in_use.get(access, 0) < self.max_size:
+						conn = None
+						break
+					remaining = None if deadline is None else deadline - monotonic()
+					if remaining is not None and remaining <= 0:
+						raise self.PoolExhausted(f"All the {self.max_size} connections are in use")
+					self.cond.wait(remaining)
+				# reserving the slot, so the lock isn't held while validating or connecting
+				self.in_use[access] = self.in_use.get(access, 0) + 1
+			if conn is None:
+				try: conn = self.connector(access)
+				except Exception:
+					with self.cond: self.free_slot(access)
+					raise
+			elif self.validate and not self.ckconn(conn):
+				self.close_conn(conn)
+				with self.cond: self.free_slot(access)
+				continue
+			with self.cond:
+				# the access rotated while validating or connecting, the connection is stale already
+				stale = requested is None and access != self.access
+				if stale: self.free_slot(access)
+				else: self.owners[id(conn)] = access
+			if not stale: return conn
+			self.close_conn(conn)
+
+	def release(self, conn, broken: bool = False):
+		"""
+		Gives back a connection to the pool. If the connection database access isn't the current one anymore, or the
+		connection is broken, it's closed instead. The rollback of the connection is done without the pool lock.
+		:param conn: The connection to give back.
+		:param broken: If the connection is broken and can't be reused.
+		:except UnknownConnection: If the connection wasn't taken from the pool.
+		:return: Nothing
+		"""
+		with self.cond:
+			access = self.owners.pop(id(conn), None)
+			if access is None: raise self.UnknownConnection("The connection wasn't taken from the pool")
+			reuse = not broken and access == self.access
+		if reuse:
+			try: conn.rollback()
+			except Exception: reuse = False
+		with self.cond:
+			# the database access may have changed during the rollback
+			reuse = reuse and access == self.access
+			if reuse: self.idle.setdefault(access, []).append((conn, monotonic()))
+			self.free_slot(access)
+		if not reuse: self.close_conn(conn)
+
+	def connection(self, access: AnyStr = None, timeout: float = None):
+		"""
+		Gives a connection of the pool to use with the 'with' statement, releasing it at the end of the block.
+		:param access: The database access of the connection, if it's None will use the current database access.
+		:param timeout: The time (seconds) to wait a connection be released.
+		:return: The context manager of the connection.
+		"""
+		return PooledConnection(self, self.acquire(access, timeout))
+
+	def close_all(self):
+		"""
+		Closes all the idle connections of the pool. The connections in use will be closed when released.
+		:return: Nothing
+		"""
+		with self.cond:
+			self.access = None
+			dropped = list(self.idle.keys())
+		for access in dropped: self.drop_access(access)
+
+	def __del__(self):
+		"""
+		Closes all the idle connections before deleting the pool from the memory.
+		:return: Nothing
+		"""
+		if hasattr(self, "cond"): self.close_all()
+
+
+class PooledConnection(object):
+	"""
+	Context manager of a connection taken from the ConnectionPool. At the end of the block the connection is commited
+	and released to the pool, if there was a exception the connection is released without commit.
+	:cvar pool: The pool that gave the connection.
+	:cvar conn: The connection taken.
+	"""
+	pool: ConnectionPool
+	conn: object
+
+	def __init__(self, pool: ConnectionPool, conn):
+		"""
+		Starts the context manager with the connection taken.
+		:param pool: The pool that gave the connection.
+		:param conn: The connection taken.
+		"""
+		self.pool = pool
+		self.conn = conn
+
+	def __enter__(self):
+		return self.conn
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		broken = False
+		if exc_type is None:
+			try: self.conn.commit()
+			except Exception: broken = True
+		self.pool.release(self.conn, broken)
+		return False
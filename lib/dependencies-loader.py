@@ -16,13 +16,16 @@ class DependenciesManager(object):
     :cvar dep_file : The dependencies file loaded.
     :cvar document: The dependencies file content parsed with the JSON methods
     :cvar got_file: If the class got a dependencies file loaded.
+    :cvar read_only: If the document was loaded from a ConfigSnapshot, then it's never written to the file.
     :type dep_file: AnyStr
     :type document: dict
     :type got_file: bool
+    :type read_only: bool
     """
     dep_file: AnyStr
     document: dict
     got_file: bool = False
+    read_only: bool = False
 
     class DependenciesLoadError(Exception):
         """
@@ -92,11 +95,11 @@ class DependenciesManager(object):
                 prs = loads(doc.read())
                 try:
                     for dep in prs['Dependencies']:
-                        if dep is not dict: return 4, "expecting a list with dicts at the Dependencies field"
+                        if type(dep) is not dict: return 4, "expecting a list with dicts at the Dependencies field"
                         try:
-                            if dep['Name'] is not str or len(dep['Name']) <= 0: return 4, "expecting string with more then one character to refer the dependency"
-                            elif dep['Package'] is not str or len(dep['Package']) <= 0: return 4, "expecting string with more then one character to refer the dependency installation name"
-                            elif dep['Installed'] is not bool: return 4, "expecting, bool to refer if the dependency '" + dep['Name'] + "' is installed"
+                            if type(dep['Name']) is not str or len(dep['Name']) <= 0: return 4, "expecting string with more then one character to refer the dependency"
+                            elif type(dep['Package']) is not str or len(dep['Package']) <= 0: return 4, "expecting string with more then one character to refer the dependency installation name"
+                            elif type(dep['Installed']) is not bool: return 4, "expecting, bool to refer if the dependency '" + dep['Name'] + "' is installed"
                             elif self.ext_countref(dep['Name'], prs) > 1: return 4, f"duplicate reference '{dep['Name']}'!"
                             else: pass
                         except IndexError or KeyError: return 3, "Invalid Structure"
@@ -105,10 +108,10 @@ class DependenciesManager(object):
                 try:
                     ver = prs['GenInfo']['Version']
                     restrict = prs['GenInfo']['Restrict']
-                    if restrict is not bool: return 4, "expecting bool to the restrict value."
-                    if ver is not str or int: return 4, "expecting int/str to the version value."
+                    if type(restrict) is not bool: return 4, "expecting bool to the restrict value."
+                    if type(ver) not in [str, int]: return 4, "expecting int/str to the version value."
                 except KeyError: return 3, "Invalid structure"
-        except FileNotFoundError or PermissionError as e: return 2, "Cant access the file, cause: " + e
+        except FileNotFoundError or PermissionError as e: return 2, "Cant access the file, cause: " + str(e)
         except JSONDecodeError: return 1, "Can't parse the JSON document!"
         else: return 0, None
 
@@ -130,9 +133,10 @@ class DependenciesManager(object):
     def commit(self):
         """
         Commit all the changes made on the document attribute, to the loaded dependencies file.
-        :except DependenciesLoadError: If there's no dependencies file loaded yet!
+        :except DependenciesLoadError: If there's no dependencies file loaded yet, or if it's read-only!
         """
         if not self.got_file: raise self.DependenciesLoadError("There's no dependencies file loaded yet!")
+        if self.read_only: raise self.DependenciesLoadError("The dependencies were loaded from a snapshot (read-only)")
         with open(self.dep_file, "w") as dp:
             dumped = dumps(self.document)
             dp.write(dumped)
@@ -140,21 +144,47 @@ class DependenciesManager(object):
     def reload(self):
         """
         Reload all the JSON content of the loaded file to the document attribute
-        :except DependenciesLoadError: If there's no dependencies file loaded.
+        :except DependenciesLoadError: If there's no dependencies file loaded, or if it was loaded from a snapshot.
         """
         if not self.got_file: raise self.DependenciesLoadError("There's no dependencies file loaded yet!")
+        if self.read_only:
+            raise self.DependenciesLoadError("The dependencies were loaded from a snapshot, reload the snapshot instead")
         with open(self.dep_file, "r") as doc: self.document = loads(doc.read())
 
     def unload_file(self):
         """
-        Commit the changes at the document and unset the class attributes, closing the dependencies file loaded.
+        Commit the changes at the document and unset the class attributes, closing the dependencies file loaded. The
+        changes aren't commited if the dependencies were loaded from a snapshot.
         :except DependenciesLoadError: If there's no dependencies file loaded
         """
         if not self.got_file: raise self.DependenciesLoadError("There's no dependencies file loaded yet!")
-        self.commit()
+        if not self.read_only: self.commit()
         self.document = dict()
         self.dep_file = ""
         self.got_file = False
+        self.read_only = False
+
+    def dump_snapshot(self) -> tuple:
+        """
+        Returns the dependencies file and the document loaded, to be published with the ConfigSnapshot class.
+        :except DependenciesLoadError: If there's no dependencies file loaded yet!
+        :return: The dependencies file path and the parsed document.
+        """
+        if not self.got_file: raise self.DependenciesLoadError("There's no dependencies file loaded yet!")
+        return self.dep_file, self.document
+
+    def load_snapshot(self, snapshot, section: str = "Dependencies"):
+        """
+        Loads the dependencies already checked by the parent process from a ConfigSnapshot, without reading the file.
+        The document loaded is read-only, it's never commited to the dependencies file.
+        :param snapshot: The ConfigSnapshot attached.
+        :param section: The snapshot section with the dependencies.
+        :except DependenciesLoadError: If there's a dependencies file loaded already
+        """
+        if self.got_file: raise self.DependenciesLoadError("There's a dependencies file loaded already")
+        self.dep_file, self.document = snapshot.get(section)
+        self.read_only = True
+        self.got_file = True
 
     def __init__(self, dep: AnyStr = None):
         """
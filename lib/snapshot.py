@@ -0,0 +1,258 @@
+# coding = utf-8
+# using namespace std
+from marshal import dumps, loads
+from mmap import mmap, ACCESS_READ, ACCESS_WRITE
+from os import replace, remove, getpid
+from struct import Struct
+from typing import AnyStr
+
+
+class ConfigSnapshot(object):
+	"""
+	That class shares the configurations documents already loaded and validated by a parent process with the worker
+	processes, so the workers don't need to read and check the same JSON files again. The snapshot uses two files:
+		* The control file (the path received), mapped to the memory by all the processes, that have the snapshot
+		  version. When the parent publishes new documents the version is changed and the workers see it. The control
+		  file is kept between publishes, so the version never goes back and the workers keep seeing it.
+		* The data file (the path received + '.' + the version), also mapped to the memory by all the processes. It
+		  starts with a small index of the sections, followed by every section serialized with marshal.
+	The data file pages are shared by all the processes that mapped it. Attaching or reloading only reads the index,
+	a section is deserialized when it's required with the get method, and the document returned is a private copy of
+	the caller, so changing it never changes the snapshot or the documents of the parent.
+	The snapshot is read-only to the workers, the classes that load a document from it (Configurations, SocketConfig
+	and DependenciesManager) don't write it back to the configurations files.
+	:cvar path: The control file path.
+	:cvar control: The control file mapped to the memory.
+	:cvar data: The data file of the loaded version mapped to the memory.
+	:cvar version: The version of the data file loaded.
+	:cvar sections: The index of the data file, the offset and the length of every section by name.
+	:cvar owner: The pid of the parent process that published the snapshot, None for the workers.
+	:cvar got_snapshot: If the class got a snapshot published/attached.
+	:type path: basestring
+	:type control: mmap
+	:type data: mmap
+	:type version: int
+	:type sections: dict
+	:type owner: int
+	:type got_snapshot: bool
+	"""
+	HEADER = Struct("<4s4xQ")
+	INDEX = Struct("<Q")
+	MAGIC = b"LPGS"
+	path: AnyStr
+	control: mmap
+	data: mmap = None
+	version: int = 0
+	sections: dict
+	owner: int = None
+	got_snapshot: bool = False
+
+	class SnapshotLoadError(Exception):
+		"""
+		<Exception> Raised when the class try to do any action with the snapshot, but there's no snapshot published or
+		attached yet. Also raised when a worker try to publish documents to a snapshot that it don't own, or when the
+		data file of the version published is missing.
+		"""
+
+	class InvalidSnapshot(Exception):
+		"""
+		<Exception> Raised when the class try to attach to a file that isn't a snapshot control file.
+		"""
+
+	class SectionNotFound(Exception):
+		"""
+		<Exception> Raised when the class try to get a section that wasn't published at the snapshot.
+		"""
+
+	def __init__(self):
+		"""
+		Starts the class without any snapshot, use the publish or attach methods to start it with a snapshot.
+		"""
+		self.path = ""
+		self.sections = dict()
+
+	def data_file(self, version: int) -> str:
+		"""
+		Returns the data file path of a snapshot version.
+		:param version: The version of the documents.
+		:return: The data file path.
+		"""
+		return f"{self.path}.{version}"
+
+	@staticmethod
+	def dump_sources(sources: dict) -> bytes:
+		"""
+		Serializes the file path and the document of the loaded objects, building the data file content.
+		:param sources: The objects with the dump_snapshot method (Configurations, SocketConfig, DependenciesManager)
+						by section name.
+		:return: The data file content, with the index size, the index of the sections and the sections serialized.
+		"""
+		index = dict()
+		blobs = []
+		offset = 0
+		for section, obj in sources.items():
+			blob = dumps(tuple(obj.dump_snapshot()))
+			index[section] = (offset, len(blob))
+			blobs.append(blob)
+			offset += len(blob)
+		dumped = dumps(index)
+		return ConfigSnapshot.INDEX.pack(len(dumped)) + dumped + b"".join(blobs)
+
+	@classmethod
+	def publish(cls, path: AnyStr, **sources):
+		"""
+		Creates a snapshot with the loaded objects, to be attached by the worker processes. If there's a control file
+		at the path already it's reused, continuing it version, so the workers attached to it see the new documents.
+		:param path: The control file path.
+		:param sources: The loaded objects by section name, like Configurations=cfg, SocketConfig=sock.
+		:return: The snapshot owned by the process.
+		"""
+		snap = cls()
+		snap.path = path
+		try:
+			with open(path, "rb") as ctrl: header = ctrl.read(cls.HEADER.size)
+		except FileNotFoundError: header = b""
+		if len(header) != cls.HEADER.size or cls.HEADER.unpack(header)[0] != cls.MAGIC:
+			# creating the control file at once, a worker never maps a empty or truncated control file
+			with open(path + ".tmp", "wb") as ctrl: ctrl.write(cls.HEADER.pack(cls.MAGIC, 0))
+			replace(path + ".tmp", path)
+		with open(path, "r+b") as ctrl: snap.control = mmap(ctrl.fileno(), cls.HEADER.size, access=ACCESS_WRITE)
+		snap.version = cls.HEADER.unpack_from(snap.control, 0)[1]
+		snap.owner = getpid()
+		snap.got_snapshot = True
+		snap.update(**sources)
+		return snap
+
+	def update(self, **sources) -> int:
+		"""
+		Publishes new documents, changing the snapshot version so the workers can reload them. The data file of the
+		previous version is kept, so a worker that is reading it isn't interrupted.
+		:param sources: The loaded objects by section name.
+		:except SnapshotLoadError: If there's no snapshot published, or if the process don't own the snapshot.
+		:return: The new version.
+		"""
+		if not self.got_snapshot: raise self.SnapshotLoadError("There's no snapshot published yet")
+		if self.owner != getpid(): raise self.SnapshotLoadError("Only the process that published the snapshot can update it")
+		content = self.dump_sources(sources)
+		version = self.version + 1
+		tmp = self.data_file(version) + ".tmp"
+		with open(tmp, "wb") as data: data.write(content)
+		replace(tmp, self.data_file(version))
+		self.load_data(version)
+		self.HEADER.pack_into(self.control, 0, self.MAGIC, version)
+		self.control.flush()
+		try: remove(self.data_file(version - 2))
+		except OSError: pass
+		return version
+
+	def load_data(self, version: int):
+		"""
+		Maps the data file of a version to the memory, reading only the index of the sections.
+		:param version: The version of the data file.
+		:except FileNotFoundError: If the data file of the version don't exist.
+		:return: Nothing
+		"""
+		with open(self.data_file(version), "rb") as data: mapped = mmap(data.fileno(), 0, access=ACCESS_READ)
+		size = self.INDEX.unpack_from(mapped, 0)[0]
+		sections = loads(mapped[self.INDEX.size:self.INDEX.size + size])
+		base = self.INDEX.size + size
+		if self.data is not None: self.data.close()
+		self.data = mapped
+		self.sections = {section: (base + offset, length) for section, (offset, length) in sections.items()}
+		self.version = version
+
+	@classmethod
+	def attach(cls, path: AnyStr):
+		"""
+		Attaches to a snapshot published by the parent process, mapping the current data file.
+		:param path: The control file path.
+		:except InvalidSnapshot: If the file isn't a snapshot control file.
+		:return: The snapshot attached.
+		"""
+		snap = cls()
+		snap.path = path
+		with open(path, "rb") as ctrl:
+			try: snap.control = mmap(ctrl.fileno(), cls.HEADER.size, access=ACCESS_READ)
+			except ValueError: raise cls.InvalidSnapshot(f"The file '{path}' isn't a snapshot control file")
+		if cls.HEADER.unpack_from(snap.control, 0)[0] != cls.MAGIC:
+			snap.control.close()
+			raise cls.InvalidSnapshot(f"The file '{path}' isn't a snapshot control file")
+		snap.got_snapshot = True
+		snap.reload()
+		return snap
+
+	def current_version(self) -> int:
+		"""
+		Reads the version published at the control file.
+		:except SnapshotLoadError: If there's no snapshot published or attached yet.
+		:return: The version published.
+		"""
+		if not self.got_snapshot: raise self.SnapshotLoadError("There's no snapshot attached yet")
+		return self.HEADER.unpack_from(self.control, 0)[1]
+
+	def changed(self) -> bool:
+		"""
+		Checks if the parent published new documents since the last reload.
+		:return: True if there's a new version published.
+		"""
+		return self.current_version() != self.version
+
+	def reload(self) -> bool:
+		"""
+		Maps the data file of the version published, if it's not mapped already.
+		:except SnapshotLoadError: If there's no snapshot published or attached yet, or if the data file of the version
+									published is missing.
+		:return: True if a new version was loaded, False if the version didn't change.
+		"""
+		while self.changed():
+			version = self.current_version()
+			try: self.load_data(version)
+			except FileNotFoundError:
+				# the parent published another version meanwhile, and removed that data file
+				if self.current_version() != version: continue
+				raise self.SnapshotLoadError(f"The data file of the version {version} is missing")
+			return True
+		return False
+
+	def get(self, section: str) -> tuple:
+		"""
+		Returns the file path and the document of a section. The section is deserialized at every call, so the document
+		returned is a copy that the caller can change without changing the snapshot.
+		:param section: The section name.
+		:except SnapshotLoadError: If there's no snapshot published or attached yet.
+		:except SectionNotFound: If the section wasn't published.
+		:return: The file path and the document of the section.
+		"""
+		if not self.got_snapshot: raise self.SnapshotLoadError("There's no snapshot attached yet")
+		if section not in self.sections.keys(): raise self.SectionNotFound(f"There's no section '{section}'")
+		offset, length = self.sections[section]
+		return loads(self.data[offset:offset + length])
+
+	def close(self, remove_files: bool = False):
+		"""
+		Closes the snapshot. If the process owns the snapshot, the data file of the previous version is removed. The
+		control file and the current data file are kept, so the workers still attached can use them and see the next
+		publish at the same path. A forked worker that got the parent snapshot object don't remove anything.
+		:param remove_files: If the owner will remove the control and data files too, only when no worker is attached.
+		:except SnapshotLoadError: If there's no snapshot published or attached yet.
+		:return: Nothing
+		"""
+		if not self.got_snapshot: raise self.SnapshotLoadError("There's no snapshot attached yet")
+		self.control.close()
+		if self.data is not None: self.data.close()
+		if self.owner == getpid():
+			files = [self.data_file(self.version - 1)]
+			if remove_files: files += [self.path, self.data_file(self.version)]
+			for fl in files:
+				try: remove(fl)
+				except OSError: pass
+		self.data = None
+		self.sections = dict()
+		self.got_snapshot = False
+
+	def __del__(self):
+		"""
+		Closes the snapshot before deleting the class instance/object from the memory.
+		:return: Nothing
+		"""
+		if self.got_snapshot: self.close()
@@ -0,0 +1,69 @@
+# coding = utf-8
+# using namespace std
+import os
+import unittest
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from lib.auth.indexer import SignatureIndex, ck_signature
+
+
+def encode(content: str) -> str:
+	return "/".join(str(ord(char)) for char in content)
+
+
+VALID = encode('{"Client":"teste","Proprietary":"12","Token":"64454","Dt":"2020-03-23 13:02:31"}')
+
+
+class SignatureIndexTest(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp = TemporaryDirectory()
+		self.store = join(self.tmp.name, "store")
+		os.mkdir(self.store)
+		for i in range(3): self.write(f"{i}.lpgp", VALID)
+		self.index = SignatureIndex(join(self.tmp.name, "index.json"))
+
+	def tearDown(self):
+		self.tmp.cleanup()
+
+	def write(self, name: str, content: str):
+		with open(join(self.store, name), "w") as sig: sig.write(content)
+
+	def test_ck_signature(self):
+		self.assertEqual(ck_signature(VALID), (True, None))
+		self.assertFalse(ck_signature(encode('{"Client":"teste"}'))[0])
+		self.assertFalse(ck_signature("1/2/x")[0])
+		self.assertFalse(ck_signature("99999999999999999999999")[0])
+
+	def test_incremental_scan(self):
+		self.assertEqual(self.index.scan([self.store], workers=2)["Added"], 3)
+		self.assertEqual(self.index.scan([self.store], workers=2)["Unchanged"], 3)
+		self.write("0.lpgp", VALID + "/32")
+		os.remove(join(self.store, "1.lpgp"))
+		stats = self.index.scan([self.store], workers=2)
+		self.assertEqual(stats, {"Added": 0, "Updated": 1, "Removed": 1, "Unchanged": 1})
+		reloaded = SignatureIndex(self.index.index_f)
+		self.assertEqual(reloaded.document, self.index.document)
+
+	def test_malformed_signature(self):
+		self.write("huge.lpgp", "99999999999999999999999")
+		self.write("bad.lpgp", "1/2/x")
+		stats = self.index.scan([self.store], workers=2)
+		self.assertEqual(stats["Added"], 5)
+		invalid = dict(self.index.invalid_signatures())
+		self.assertEqual(sorted(invalid.keys()), sorted(
+			[os.path.abspath(join(self.store, "huge.lpgp")), os.path.abspath(join(self.store, "bad.lpgp"))]))
+		self.assertTrue(os.path.exists(self.index.index_f))
+
+	def test_retry_unreadable(self):
+		self.index.scan([self.store], workers=2)
+		path = os.path.abspath(join(self.store, "0.lpgp"))
+		self.index.document[path][2:] = [None, False, "Can't access the file [Permission denied]"]
+		stats = self.index.scan([self.store], workers=2)
+		self.assertEqual(stats["Updated"], 1)
+		self.assertTrue(self.index.get_entry(path)["Valid"])
+
+
+if __name__ == "__main__":
+	unittest.main()
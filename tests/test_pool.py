@@ -0,0 +1,126 @@
+# coding = utf-8
+# using namespace std
+import sqlite3
+import time
+import unittest
+from functools import partial
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Thread
+
+from lib.auth.pool import ConnectionPool
+
+
+def is_closed(conn) -> bool:
+	try: conn.execute("SELECT 1")
+	except sqlite3.ProgrammingError: return True
+	else: return False
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp = TemporaryDirectory()
+		self.first = join(self.tmp.name, "first.db")
+		self.second = join(self.tmp.name, "second.db")
+		self.pool = ConnectionPool(partial(sqlite3.connect, check_same_thread=False), max_size=2, idle_timeout=60)
+		self.pool.from_auth(("1", self.first))
+
+	def tearDown(self):
+		self.pool.close_all()
+		self.tmp.cleanup()
+
+	def test_max_size(self):
+		first = self.pool.acquire()
+		second = self.pool.acquire()
+		with self.assertRaises(ConnectionPool.PoolExhausted): self.pool.acquire(timeout=0.05)
+		self.pool.release(first)
+		self.assertIs(self.pool.acquire(timeout=0.05), first)
+		self.pool.release(second)
+
+	def test_waits_release(self):
+		first = self.pool.acquire()
+		self.pool.acquire()
+		Thread(target=lambda: (time.sleep(0.05), self.pool.release(first))).start()
+		self.assertIs(self.pool.acquire(timeout=5), first)
+
+	def test_idle_prune(self):
+		self.pool.idle_timeout = 0.01
+		conn = self.pool.acquire()
+		self.pool.release(conn)
+		time.sleep(0.05)
+		self.pool.prune()
+		self.assertEqual(self.pool.idle, {})
+		self.assertTrue(is_closed(conn))
+
+	def test_validation_drops_dead(self):
+		conn = self.pool.acquire()
+		self.pool.release(conn)
+		conn.close()
+		fresh = self.pool.acquire()
+		self.assertIsNot(fresh, conn)
+		self.assertFalse(is_closed(fresh))
+		self.assertEqual(self.pool.in_use, {self.first: 1})
+
+	def test_rotation(self):
+		idle = self.pool.acquire()
+		used = self.pool.acquire()
+		self.pool.release(idle)
+		self.assertTrue(self.pool.from_auth(("1", self.second)))
+		self.assertFalse(self.pool.from_auth(("1", self.second)))
+		self.assertTrue(is_closed(idle))
+		self.assertFalse(is_closed(used))
+		self.pool.release(used)
+		self.assertTrue(is_closed(used))
+		self.assertEqual(self.pool.idle, {})
+		with self.pool.connection() as conn: conn.execute("CREATE TABLE rotated (id INTEGER)")
+		with sqlite3.connect(self.second) as check: check.execute("SELECT * FROM rotated")
+
+	def test_rotation_while_waiting(self):
+		opened = []
+		connector = partial(sqlite3.connect, check_same_thread=False)
+		self.pool.connector = lambda access: (opened.append(access), connector(access))[1]
+		self.pool.max_size = 1
+		held = self.pool.acquire()
+		got = []
+		waiter = Thread(target=lambda: got.append(self.pool.acquire(timeout=5)))
+		waiter.start()
+		time.sleep(0.05)
+		self.pool.from_auth(("1", self.second))
+		self.pool.release(held)
+		waiter.join()
+		self.assertEqual(opened, [self.first, self.second])
+		self.assertEqual(self.pool.owners[id(got[0])], self.second)
+		self.assertTrue(is_closed(held))
+
+	def test_wakes_waiter_of_released_access(self):
+		self.pool.max_size = 1
+		first = self.pool.acquire(self.first)
+		self.pool.acquire(self.second)
+		got = dict()
+
+		def wait_second():
+			with self.assertRaises(ConnectionPool.PoolExhausted): self.pool.acquire(self.second, timeout=0.5)
+
+		waiters = [Thread(target=wait_second), Thread(target=lambda: got.setdefault("first", self.pool.acquire(self.first, timeout=5)))]
+		for waiter in waiters:
+			waiter.start()
+			time.sleep(0.05)
+		self.pool.release(first)
+		waiters[1].join(timeout=1)
+		self.assertIs(got.get("first"), first)
+		waiters[0].join()
+
+	def test_release_other_thread(self):
+		conn = self.pool.acquire()
+		worker = Thread(target=self.pool.release, args=(conn,))
+		worker.start()
+		worker.join()
+		self.assertIs(self.pool.acquire(), conn)
+
+	def test_failed_auth(self):
+		with self.assertRaises(ConnectionPool.AccessNotLoaded): self.pool.from_auth(("0", None))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,149 @@
+# coding = utf-8
+# using namespace std
+import multiprocessing
+import os
+import shutil
+import unittest
+from json import dumps, loads
+from importlib.util import spec_from_file_location, module_from_spec
+from os.path import join, dirname, abspath
+from tempfile import TemporaryDirectory
+
+from config.configurations import Configurations
+from lib.auth.authcore import SocketConfig
+from lib.snapshot import ConfigSnapshot
+
+ROOT = dirname(dirname(abspath(__file__)))
+
+
+def load_dependencies_module():
+	spec = spec_from_file_location("dependencies_loader", join(ROOT, "lib", "dependencies-loader.py"))
+	module = module_from_spec(spec)
+	spec.loader.exec_module(module)
+	return module
+
+
+def attached_version(path: str, queue):
+	snap = ConfigSnapshot.attach(path)
+	cfg = Configurations()
+	cfg.load_snapshot(snap)
+	queue.put((snap.version, cfg.document['CLI']['Color']))
+
+
+class ConfigSnapshotTest(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp = TemporaryDirectory()
+		self.conf = join(self.tmp.name, "gen.json")
+		shutil.copy(join(ROOT, "config", "gen.json"), self.conf)
+		self.cfg = Configurations(self.conf)
+		self.path = join(self.tmp.name, "lpgp.snap")
+
+	def tearDown(self):
+		self.cfg.unload_file()
+		self.tmp.cleanup()
+
+	def test_update_reload(self):
+		snap = ConfigSnapshot.publish(self.path, Configurations=self.cfg)
+		worker = ConfigSnapshot.attach(self.path)
+		self.assertFalse(worker.changed())
+		self.cfg.document['CLI']['Color'] = False
+		self.assertEqual(snap.update(Configurations=self.cfg), 2)
+		self.assertTrue(worker.changed())
+		self.assertTrue(worker.reload())
+		self.assertFalse(worker.get("Configurations")[1]['CLI']['Color'])
+		self.assertFalse(worker.reload())
+		with self.assertRaises(ConfigSnapshot.SectionNotFound): worker.get("SocketConfig")
+		with self.assertRaises(ConfigSnapshot.SnapshotLoadError): worker.update(Configurations=self.cfg)
+		worker.close()
+		snap.close(remove_files=True)
+		self.assertEqual([fl for fl in os.listdir(self.tmp.name) if fl.startswith("lpgp.snap")], [])
+
+	def test_republish_same_path(self):
+		first = ConfigSnapshot.publish(self.path, Configurations=self.cfg)
+		worker = ConfigSnapshot.attach(self.path)
+		first.close()
+		self.cfg.document['CLI']['Color'] = False
+		second = ConfigSnapshot.publish(self.path, Configurations=self.cfg)
+		self.assertEqual(second.version, 2)
+		self.assertTrue(worker.reload())
+		self.assertFalse(worker.get("Configurations")[1]['CLI']['Color'])
+		worker.close()
+		second.close(remove_files=True)
+
+	def test_worker_process(self):
+		snap = ConfigSnapshot.publish(self.path, Configurations=self.cfg)
+		queue = multiprocessing.Queue()
+		worker = multiprocessing.Process(target=attached_version, args=(self.path, queue))
+		worker.start()
+		self.assertEqual(queue.get(timeout=30), (1, True))
+		worker.join()
+		snap.close(remove_files=True)
+
+	def test_missing_data_file(self):
+		snap = ConfigSnapshot.publish(self.path, Configurations=self.cfg)
+		worker = ConfigSnapshot.attach(self.path)
+		snap.update(Configurations=self.cfg)
+		os.remove(snap.data_file(2))
+		with self.assertRaises(ConfigSnapshot.SnapshotLoadError): worker.reload()
+		self.assertEqual(worker.version, 1)
+		worker.close()
+		snap.close(remove_files=True)
+
+	def test_read_only(self):
+		with open(self.conf, "r") as fl: original = fl.read()
+		snap = ConfigSnapshot.publish(self.path, Configurations=self.cfg)
+		cfg = Configurations()
+		cfg.load_snapshot(snap)
+		self.assertIsNot(cfg.document, self.cfg.document)
+		cfg.document['CLI']['Color'] = False
+		self.assertTrue(self.cfg.document['CLI']['Color'])
+		self.assertTrue(snap.get("Configurations")[1]['CLI']['Color'])
+		with self.assertRaises(Configurations.ConfigurationsLoadError): cfg.commit()
+		cfg.unload_file()
+		with open(self.conf, "r") as fl: self.assertEqual(fl.read(), original)
+		snap.close(remove_files=True)
+
+	def test_dependencies(self):
+		module = load_dependencies_module()
+		deps = join(self.tmp.name, "dependencies.json")
+		with open(deps, "w") as fl:
+			fl.write(dumps({
+				"Dependencies": [{"Name": "requests", "Package": "requests", "Installed": False}],
+				"GenInfo": {"Version": "alpha", "Restrict": False}
+			}))
+		source = module.DependenciesManager(deps)
+		snap = ConfigSnapshot.publish(self.path, Dependencies=source)
+		manager = module.DependenciesManager()
+		manager.load_snapshot(snap)
+		self.assertEqual(manager.document, source.document)
+		manager.document['Dependencies'][0]['Installed'] = True
+		self.assertFalse(source.document['Dependencies'][0]['Installed'])
+		with self.assertRaises(manager.DependenciesLoadError): manager.reload()
+		with self.assertRaises(manager.DependenciesLoadError): manager.commit()
+		manager.unload_file()
+		source.unload_file()
+		with open(deps, "r") as fl: self.assertFalse(loads(fl.read())['Dependencies'][0]['Installed'])
+		snap.close(remove_files=True)
+
+	def test_socket_config(self):
+		conf = join(self.tmp.name, "sock.json")
+		with open(join(ROOT, "lib", "auth", "config.json"), "r") as fl: prs = loads(fl.read())
+		prs['Action']['auth-file'] = join(ROOT, "lib", "auth", "auth.lpgp")
+		with open(conf, "w") as fl: fl.write(dumps(prs))
+		source = SocketConfig(conf)
+		snap = ConfigSnapshot.publish(self.path, SocketConfig=source)
+		worker = ConfigSnapshot.attach(self.path)
+		sock = SocketConfig()
+		sock.load_snapshot(worker)
+		self.assertEqual(sock.file_got, conf)
+		self.assertEqual(sock.config, source.config)
+		with self.assertRaises(SocketConfig.ConfigLoadError): sock.commit()
+		sock.unload()
+		source.unload()
+		worker.close()
+		snap.close(remove_files=True)
+
+
+if __name__ == "__main__":
+	unittest.main()